@@ -8,32 +8,109 @@
     1 light -> (1,0)
     2 dark  -> (0,0)
     3 black -> (0,1)
-- Produces 16 bytes (low/high per row), then swaps pairs for little endian output.
+- Produces 16 bytes (low/high per row), emitted pair-swapped for little endian output.
 - Hex field is editable: pressing Enter updates the tile graphics.
 """
 
 import tkinter as tk
 from tkinter import messagebox
 
-GRID = 8
+try:
+    import numpy as np
+except ImportError:  # fall back to the pure-Python tile codec below
+    np = None
 
-PALETTE = [
+GRID = 8  # the tile codec requires GRID == 8: a GB tile row is one byte per bit plane
+
+PALETTE = (
     "#FFFFFF",  # 0 white
     "#C0C0C0",  # 1 light gray
     "#606060",  # 2 dark gray
     "#000000",  # 3 black
-]
-
-# confirmed GB bit mapping
-GB_MAPPING = {
-    0: (1, 1),  # white
-    1: (1, 0),  # light
-    2: (0, 0),  # dark
-    3: (0, 1),  # black
-}
-
-# reverse mapping: (low,high) -> index
-GB_REVERSE = {v: k for k, v in GB_MAPPING.items()}
+)
+
+# confirmed GB bit mapping, indexed by palette index
+#         white light dark black
+LOW_OF = (1, 1, 0, 0)
+HIGH_OF = (1, 0, 0, 1)
+
+# reverse mapping, indexed by (low << 1) | high -> palette index
+IDX_OF = (2, 3, 1, 0)
+
+# ------------------ GB tile codec ------------------
+# encode_tile: 64 row-major palette indices -> 16 little endian tile bytes
+# decode_tile: 16 little endian tile bytes -> 64 row-major palette indices
+# Every row is stored as the pair (high, low) in the little endian output.
+
+if np is not None:
+    # encode_tile computes LOW_OF/HIGH_OF as bit arithmetic on the palette index:
+    #   low  = 1 for white/light -> (idx >> 1) ^ 1
+    #   high = 1 for white/black -> ((idx ^ (idx >> 1)) & 1) ^ 1
+
+    # the 8 bits of every byte value, msb first (x = 0 is the most significant bit)
+    BYTE_TO_BITS = np.unpackbits(np.arange(256, dtype=np.uint8).reshape(-1, 1), axis=1)
+
+    GB_REVERSE_LUT = np.array(IDX_OF, dtype=np.uint8)
+
+    def encode_tile(grid):
+        pixels = np.frombuffer(grid, dtype=np.uint8).reshape(GRID, GRID)
+        msb = pixels >> 1
+        tile = np.empty((GRID, 2), dtype=np.uint8)
+        tile[:, 0] = np.packbits(((pixels ^ msb) & 1) ^ 1, axis=1).ravel()
+        tile[:, 1] = np.packbits(msb ^ 1, axis=1).ravel()
+        return tile.tobytes()
+
+    def decode_tile(data):
+        tile = np.frombuffer(data, dtype=np.uint8).reshape(GRID, 2)
+        hi = BYTE_TO_BITS[tile[:, 0]]
+        lo = BYTE_TO_BITS[tile[:, 1]]
+        return GB_REVERSE_LUT[(lo << 1) | hi].tobytes()
+
+else:
+    # LOW_OF/HIGH_OF bits already shifted into place, indexed by 4 * x + idx
+    LOW_TABLE = bytes(LOW_OF[idx] << (7 - x) for x in range(8) for idx in range(4))
+    HIGH_TABLE = bytes(HIGH_OF[idx] << (7 - x) for x in range(8) for idx in range(4))
+
+    def encode_tile(grid):
+        lt = LOW_TABLE
+        ht = HIGH_TABLE
+        tile = bytearray(16)
+        # the 8 pixels of a row are unrolled
+        for y in range(8):
+            p0, p1, p2, p3, p4, p5, p6, p7 = grid[y * 8 : y * 8 + 8]
+            tile[2 * y] = (
+                ht[p0]
+                | ht[4 + p1]
+                | ht[8 + p2]
+                | ht[12 + p3]
+                | ht[16 + p4]
+                | ht[20 + p5]
+                | ht[24 + p6]
+                | ht[28 + p7]
+            )
+            tile[2 * y + 1] = (
+                lt[p0]
+                | lt[4 + p1]
+                | lt[8 + p2]
+                | lt[12 + p3]
+                | lt[16 + p4]
+                | lt[20 + p5]
+                | lt[24 + p6]
+                | lt[28 + p7]
+            )
+        return bytes(tile)
+
+    def decode_tile(data):
+        grid = bytearray(64)
+        for row in range(8):
+            high = data[2 * row]
+            low = data[2 * row + 1]
+            for x in range(8):
+                bit = 7 - x
+                lo = (low >> bit) & 1
+                hi = (high >> bit) & 1
+                grid[row * 8 + x] = IDX_OF[(lo << 1) | hi]
+        return bytes(grid)
 
 
 class GBPixelEditor(tk.Tk):
@@ -42,13 +119,23 @@ class GBPixelEditor(tk.Tk):
         self.title("8x8 Game Boy Tile Editor")
         self.resizable(False, False)
 
-        self.grid_data = [[0 for _ in range(GRID)] for _ in range(GRID)]
+        # flat row-major pixel buffer, index y * GRID + x
+        self.grid_data = bytearray(GRID * GRID)
         self.current = 3  # default black
+        self._hex_pending = False
 
         # tiny 8x8 canvas
         self.canvas = tk.Canvas(self, width=GRID, height=GRID, bd=1, relief="solid")
         self.canvas.grid(row=0, column=0, padx=10, pady=10)
-        self._draw_canvas()
+        self._canvas_ids = [
+            [
+                self.canvas.create_rectangle(x, y, x + 1, y + 1, fill=PALETTE[0], outline="")
+                for x in range(GRID)
+            ]
+            for y in range(GRID)
+        ]
+        # palette index each rectangle currently shows, to skip no-op recolors
+        self._canvas_shown = bytearray(GRID * GRID)
 
         # large preview
         self.preview_scale = 24
@@ -60,6 +147,12 @@ class GBPixelEditor(tk.Tk):
             relief="solid",
         )
         self.preview.grid(row=0, column=1, padx=10, pady=10)
+        # the preview is a single image; painting fills the scaled pixel block
+        size = GRID * self.preview_scale
+        self._preview_img = tk.PhotoImage(master=self, width=size, height=size)
+        self._preview_img.put(PALETTE[0], to=(0, 0, size, size))
+        self.preview.create_image(0, 0, anchor="nw", image=self._preview_img)
+        self._preview_shown = bytearray(GRID * GRID)
 
         # palette
         controls = tk.Frame(self)
@@ -95,11 +188,13 @@ class GBPixelEditor(tk.Tk):
         tk.Label(self, text="GB little-endian hex (edit & press Enter):").grid(
             row=1, column=0, columnspan=3, sticky="w", padx=10
         )
-        self.hex_entry = tk.Entry(self, width=60)
+        self.hex_var = tk.StringVar(self)
+        self.hex_entry = tk.Entry(self, textvariable=self.hex_var, width=60)
         self.hex_entry.grid(row=2, column=0, columnspan=3, padx=10, pady=(0, 10))
         self.hex_entry.bind("<Return>", self.hex_changed)
 
-        # initial preview & hex
+        # initial canvas, preview & hex
+        self._draw_canvas()
         self._update_preview()
         self._update_hex_display()
 
@@ -110,9 +205,7 @@ class GBPixelEditor(tk.Tk):
         self.current_display.config(bg=PALETTE[idx])
 
     def clear(self):
-        for y in range(GRID):
-            for x in range(GRID):
-                self.grid_data[y][x] = 0
+        self.grid_data[:] = bytes(GRID * GRID)
         self._draw_canvas()
         self._update_preview()
         self._update_hex_display()
@@ -120,137 +213,109 @@ class GBPixelEditor(tk.Tk):
     # ------------------ painting ------------------
 
     def paint_left(self, event):
-        x = int(event.x)
-        y = int(event.y)
+        x = event.x
+        y = event.y
         if 0 <= x < GRID and 0 <= y < GRID:
-            self.grid_data[y][x] = self.current
+            self.grid_data[y * GRID + x] = self.current
             self._draw_pixel(x, y)
-            self._update_preview()
-            self._update_hex_display()
+            self._draw_preview_pixel(x, y)
+            self._schedule_hex_update()
 
     def paint_right(self, event):
-        x = int(event.x)
-        y = int(event.y)
+        x = event.x
+        y = event.y
         if 0 <= x < GRID and 0 <= y < GRID:
-            self.grid_data[y][x] = 0
+            self.grid_data[y * GRID + x] = 0
             self._draw_pixel(x, y)
-            self._update_preview()
-            self._update_hex_display()
+            self._draw_preview_pixel(x, y)
+            self._schedule_hex_update()
 
     def paint_preview_left(self, event):
-        x = int(event.x // self.preview_scale)
-        y = int(event.y // self.preview_scale)
+        x = event.x // self.preview_scale
+        y = event.y // self.preview_scale
         if 0 <= x < GRID and 0 <= y < GRID:
-            self.grid_data[y][x] = self.current
-            self._draw_canvas()
-            self._update_preview()
-            self._update_hex_display()
+            self.grid_data[y * GRID + x] = self.current
+            self._draw_pixel(x, y)
+            self._draw_preview_pixel(x, y)
+            self._schedule_hex_update()
 
     def paint_preview_right(self, event):
-        x = int(event.x // self.preview_scale)
-        y = int(event.y // self.preview_scale)
+        x = event.x // self.preview_scale
+        y = event.y // self.preview_scale
         if 0 <= x < GRID and 0 <= y < GRID:
-            self.grid_data[y][x] = 0
-            self._draw_canvas()
-            self._update_preview()
-            self._update_hex_display()
+            self.grid_data[y * GRID + x] = 0
+            self._draw_pixel(x, y)
+            self._draw_preview_pixel(x, y)
+            self._schedule_hex_update()
 
     # ------------------ drawing ------------------
 
+    # pixels are drawn by recoloring the items created in __init__
+
     def _draw_canvas(self):
-        self.canvas.delete("all")
         for y in range(GRID):
             for x in range(GRID):
                 self._draw_pixel(x, y)
 
     def _draw_pixel(self, x, y):
-        tag = f"p_{x}_{y}"
-        self.canvas.delete(tag)
-        col = PALETTE[self.grid_data[y][x]]
-        self.canvas.create_rectangle(x, y, x + 1, y + 1, fill=col, outline="", tags=tag)
+        i = y * GRID + x
+        idx = self.grid_data[i]
+        if self._canvas_shown[i] == idx:
+            return
+        self._canvas_shown[i] = idx
+        self.canvas.itemconfig(self._canvas_ids[y][x], fill=PALETTE[idx])
 
     def _update_preview(self):
-        self.preview.delete("all")
-        s = self.preview_scale
         for y in range(GRID):
             for x in range(GRID):
-                col = PALETTE[self.grid_data[y][x]]
-                self.preview.create_rectangle(
-                    x * s, y * s, x * s + s, y * s + s, fill=col, outline=""
-                )
+                self._draw_preview_pixel(x, y)
+
+    def _draw_preview_pixel(self, x, y):
+        i = y * GRID + x
+        idx = self.grid_data[i]
+        if self._preview_shown[i] == idx:
+            return
+        self._preview_shown[i] = idx
+        s = self.preview_scale
+        self._preview_img.put(PALETTE[idx], to=(x * s, y * s, x * s + s, y * s + s))
 
     # ------------------ GB encoding ------------------
 
-    def grid_to_tile_bytes(self):
-        tile = []
-        for y in range(GRID):
-            low = 0
-            high = 0
-            for x in range(GRID):
-                lo, hi = GB_MAPPING[self.grid_data[y][x]]
-                low |= lo << (7 - x)
-                high |= hi << (7 - x)
-            tile.append(low)
-            tile.append(high)
-        return tile
-
-    @staticmethod
-    def to_little_endian_pairs(tile_bytes):
-        out = []
-        for i in range(0, 16, 2):
-            a = tile_bytes[i]
-            b = tile_bytes[i + 1]
-            out.append(b)
-            out.append(a)
-        return out
+    def grid_to_tile_bytes_le(self):
+        return encode_tile(self.grid_data)
+
+    def _schedule_hex_update(self):
+        # coalesce the many paint events of a drag into one hex update
+        if not self._hex_pending:
+            self._hex_pending = True
+            self.after_idle(self._flush_hex)
+
+    def _flush_hex(self):
+        self._hex_pending = False
+        self._update_hex_display()
 
     def _update_hex_display(self):
-        tile = self.grid_to_tile_bytes()
-        swapped = self.to_little_endian_pairs(tile)
-        hex_str = " ".join(f"{b:02X}" for b in swapped)
-        self.hex_entry.delete(0, tk.END)
-        self.hex_entry.insert(0, hex_str)
+        tile_le = self.grid_to_tile_bytes_le()
+        self.hex_var.set(tile_le.hex(" ").upper())
 
     # ------------------ Hex → Grid decoding ------------------
 
     def hex_changed(self, event=None):
-        text = self.hex_entry.get().strip()
-        parts = text.split()
-
-        if len(parts) != 16:
-            messagebox.showerror("Error", "Hex must contain exactly 16 bytes.")
-            return
+        text = self.hex_var.get()
 
         try:
-            bytes_le = [int(p, 16) for p in parts]
+            # fromhex skips whitespace between byte pairs but rejects half-byte tokens
+            bytes_le = bytes.fromhex(text.replace(",", " "))
         except ValueError:
             messagebox.showerror("Error", "Invalid hex byte detected.")
             return
 
-        # undo little endian swap
-        tile = []
-        for i in range(0, 16, 2):
-            b = bytes_le[i]
-            a = bytes_le[i + 1]
-            tile.append(a)
-            tile.append(b)
-
-        # decode:
-        # tile = [low,row0, high,row0, low,row1, high,row1 ...]
-        try:
-            for row in range(8):
-                low = tile[2 * row]
-                high = tile[2 * row + 1]
-                for x in range(8):
-                    bit = 7 - x
-                    lo = (low >> bit) & 1
-                    hi = (high >> bit) & 1
-                    idx = GB_REVERSE[(lo, hi)]
-                    self.grid_data[row][x] = idx
-        except Exception:
-            messagebox.showerror("Error", "Hex does not map to valid GB color codes.")
+        if len(bytes_le) != 16:
+            messagebox.showerror("Error", "Hex must contain exactly 16 bytes.")
             return
 
+        self.grid_data[:] = decode_tile(bytes_le)
+
         self._draw_canvas()
         self._update_preview()
 
@@ -0,0 +1,114 @@
+import importlib.util
+import os
+import random
+import sys
+import unittest
+from unittest import mock
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+
+# baseline dict-loop codec the kernels must stay compatible with
+GB_MAPPING = {
+    0: (1, 1),  # white
+    1: (1, 0),  # light
+    2: (0, 0),  # dark
+    3: (0, 1),  # black
+}
+GB_REVERSE = {v: k for k, v in GB_MAPPING.items()}
+
+
+def baseline_encode(grid):
+    out = []
+    for y in range(8):
+        low = 0
+        high = 0
+        for x in range(8):
+            lo, hi = GB_MAPPING[grid[y * 8 + x]]
+            low |= lo << (7 - x)
+            high |= hi << (7 - x)
+        out.append(high)
+        out.append(low)
+    return bytes(out)
+
+
+def baseline_decode(data):
+    grid = []
+    for row in range(8):
+        high = data[2 * row]
+        low = data[2 * row + 1]
+        for x in range(8):
+            bit = 7 - x
+            grid.append(GB_REVERSE[((low >> bit) & 1, (high >> bit) & 1)])
+    return bytes(grid)
+
+
+def load_elby(without_numpy=False):
+    spec = importlib.util.spec_from_file_location("elby_under_test", os.path.join(HERE, "Elby.py"))
+    module = importlib.util.module_from_spec(spec)
+    modules = {"numpy": None} if without_numpy else {}
+    with mock.patch.dict(sys.modules, modules):
+        spec.loader.exec_module(module)
+    return module
+
+
+class CodecTests:
+    without_numpy = False
+
+    @classmethod
+    def setUpClass(cls):
+        cls.elby = load_elby(cls.without_numpy)
+        cls.rng = random.Random(0)
+
+    def random_grid(self):
+        return bytes(self.rng.randrange(4) for _ in range(64))
+
+    def test_backend(self):
+        self.assertEqual(self.elby.np is None, self.without_numpy)
+
+    def test_encode_matches_baseline(self):
+        for _ in range(500):
+            grid = self.random_grid()
+            self.assertEqual(self.elby.encode_tile(bytearray(grid)), baseline_encode(grid))
+
+    def test_decode_matches_baseline(self):
+        for _ in range(500):
+            data = self.rng.randbytes(16)
+            self.assertEqual(self.elby.decode_tile(data), baseline_decode(data))
+
+    def test_round_trip(self):
+        for _ in range(500):
+            grid = self.random_grid()
+            self.assertEqual(self.elby.decode_tile(self.elby.encode_tile(bytearray(grid))), grid)
+            data = self.rng.randbytes(16)
+            self.assertEqual(self.elby.encode_tile(bytearray(self.elby.decode_tile(data))), data)
+
+    def test_bit_arithmetic_matches_mapping(self):
+        # the NumPy encode_tile derives the bit planes arithmetically
+        for i in range(4):
+            low = (i >> 1) ^ 1
+            high = ((i ^ (i >> 1)) & 1) ^ 1
+            self.assertEqual((low, high), GB_MAPPING[i])
+            self.assertEqual((self.elby.LOW_OF[i], self.elby.HIGH_OF[i]), GB_MAPPING[i])
+
+    def test_reverse_mapping_inverts_forward_mapping(self):
+        elby = self.elby
+        for i in range(4):
+            self.assertEqual(elby.IDX_OF[(elby.LOW_OF[i] << 1) | elby.HIGH_OF[i]], i)
+
+
+class NumpyCodecTests(CodecTests, unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        try:
+            import numpy  # noqa: F401
+        except ImportError:
+            raise unittest.SkipTest("NumPy is not installed")
+        super().setUpClass()
+
+
+class PurePythonCodecTests(CodecTests, unittest.TestCase):
+    without_numpy = True
+
+
+if __name__ == "__main__":
+    unittest.main()